@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+⚡ Optional Numba-accelerated vocabulary scanning
+================================================
+Compute-bound substring scans over six-figure vocabs (the endless
+<|end|> check) run as JIT-compiled parallel loops over a packed UTF-8
+byte arena when numba is installed. Without numba everything falls back
+to the plain generator scan - same answers, just interpreter speed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import ahocorasick  # optional: one-pass multi-pattern matching
+except ImportError:
+    ahocorasick = None
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _count_bad(data, offsets, needle):
+        """Count tokens whose bytes contain needle (parallel over tokens)"""
+        count = 0
+        m = needle.size
+        for i in prange(offsets.size - 1):
+            start = offsets[i]
+            last = offsets[i + 1] - m
+            found = 0
+            j = start
+            while j <= last:
+                k = 0
+                while k < m and data[j + k] == needle[k]:
+                    k += 1
+                if k == m:
+                    found = 1
+                    break
+                j += 1
+            count += found
+        return count
+
+def pack_tokens(tokens):
+    """Concatenate tokens into one UTF-8 arena + int64 offsets (SoA)"""
+    data = bytearray()
+    offsets = np.empty(len(tokens) + 1, dtype=np.int64)
+    offsets[0] = 0
+    for i, token in enumerate(tokens):
+        data += token.encode('utf-8')
+        offsets[i + 1] = len(data)
+    return np.frombuffer(bytes(data), dtype=np.uint8), offsets
+
+class PackedVocab:
+    """Vocabulary as one UTF-8 byte arena + offsets (SoA)
+
+    A 256k-token list of str carries ~50 bytes of object header per
+    token; packed storage is one bytes blob and one int64 offsets array.
+    Substring scans run over the arena at C (or numba) speed and the UI
+    decodes individual tokens on demand.
+    """
+
+    __slots__ = ('data', 'offsets', 'char_offsets')
+
+    def __init__(self, tokens):
+        arena, self.offsets = pack_tokens(tokens)
+        self.data = arena.tobytes()
+        # Character offsets (for mapping str-level automaton hits back
+        # to tokens - byte offsets drift on non-ASCII vocabs)
+        self.char_offsets = np.cumsum([0] + [len(t) for t in tokens])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]].decode('utf-8')
+
+    def __repr__(self):
+        return f"<PackedVocab {len(self)} tokens, {len(self.data)} bytes>"
+
+    def count_containing(self, needle: str) -> int:
+        """Count tokens containing needle without touching token objects"""
+        needle_bytes = needle.encode('utf-8')
+        if njit is not None:
+            return int(_count_bad(np.frombuffer(self.data, dtype=np.uint8),
+                                  self.offsets,
+                                  np.frombuffer(needle_bytes, dtype=np.uint8)))
+        # bytes.find over the whole arena: one C call per match, with
+        # searchsorted mapping hit positions back to token indices
+        hits = set()
+        start = self.data.find(needle_bytes)
+        while start != -1:
+            token = int(np.searchsorted(self.offsets, start, side='right')) - 1
+            if start + len(needle_bytes) <= self.offsets[token + 1]:
+                hits.add(token)
+            start = self.data.find(needle_bytes, start + 1)
+        return len(hits)
+
+    def scan_patterns(self, patterns):
+        """Count tokens containing each pattern; one arena pass if possible
+
+        With pyahocorasick installed every pattern is matched in a
+        single automaton sweep over the arena - O(n + matches) instead
+        of one full scan per pattern. Fallback is a count_containing
+        scan per pattern.
+        """
+        if ahocorasick is None:
+            return {pattern: self.count_containing(pattern) for pattern in patterns}
+
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+
+        text = self.data.decode('utf-8')
+        hits = {pattern: set() for pattern in patterns}
+        for end, pattern in automaton.iter(text):
+            start = end - len(pattern) + 1
+            token = int(np.searchsorted(self.char_offsets, start, side='right')) - 1
+            if end < self.char_offsets[token + 1]:  # inside one token
+                hits[pattern].add(token)
+        return {pattern: len(tokens) for pattern, tokens in hits.items()}
+
+def count_containing(tokens, needle: str) -> int:
+    """Count tokens containing needle, JIT-compiled when it pays off
+
+    Small vocabs (or no numba) use the generator scan - packing the
+    arena costs more than it saves below a few thousand tokens.
+    """
+    if njit is None or len(tokens) < 4096:
+        return sum(needle in t for t in tokens)
+    data, offsets = pack_tokens(tokens)
+    return int(_count_bad(data, offsets,
+                          np.frombuffer(needle.encode('utf-8'), dtype=np.uint8)))
+
+def warmup():
+    """Trigger JIT compilation off the critical path (call at startup)"""
+    if njit is not None:
+        _count_bad(np.zeros(1, dtype=np.uint8),
+                   np.zeros(2, dtype=np.int64),
+                   np.ones(1, dtype=np.uint8))
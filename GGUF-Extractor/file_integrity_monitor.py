@@ -6,95 +6,438 @@ Monitors GGUF GUI files for mysterious deletions/modifications
 WITHOUT using git or uploading anything to the internet!
 """
 
+import base64
 import hashlib
 import json
+import mmap
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Fast hashing: BLAKE3 (SIMD + parallel) when available, BLAKE2b otherwise.
+# We only need change detection, not signatures, so speed wins over SHA-256!
+# Set FIM_HASH_ALGO=sha256 if you need SHA-256 compatible baselines; that
+# path uses the OpenSSL-backed hashlib.sha256 which auto-selects SHA-NI
+# instructions as long as we feed it big chunks (we use 1 MiB).
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# orjson parses/serializes JSON 3-5x faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson lets us stream huge baselines instead of materializing them
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# msgpack gives a 3-5x smaller baseline file that parses ~10x faster
+# than indented JSON - worth it for a fixed per-file schema
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Baselines smaller than this are parsed in one go; bigger ones stream
+STREAM_THRESHOLD = 1 << 20
+
+if os.environ.get("FIM_HASH_ALGO") == "sha256" or blake3 is None and "blake2b" not in hashlib.algorithms_available:
+    blake3 = None
+    HASH_ALGORITHM = "sha256"
+    HASH_CTOR = hashlib.sha256  # OpenSSL openssl_sha256 → SHA-NI on modern CPUs
+elif blake3 is not None:
+    HASH_ALGORITHM = "blake3"
+    HASH_CTOR = blake3.blake3
+else:
+    HASH_ALGORITHM = "blake2b"
+    HASH_CTOR = lambda: hashlib.blake2b(digest_size=32)
+
+# Files bigger than this are hashed via mmap instead of read() chunks
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
 class FileIntegrityMonitor:
     def __init__(self):
-        self.monitor_file = Path("file_integrity.json")
+        self.monitor_file = Path("file_integrity.mp" if msgpack else "file_integrity.json")
         self.watched_files = [
             "gguf_gui.py",
-            "gguf_extractor.py", 
+            "gguf_extractor.py",
             "gguf_cli.py"
         ]
-        
-    def calculate_file_hash(self, filepath):
-        """Calculate SHA256 hash of file"""
+        # Parsed baseline cache: (mtime_ns, baseline dict)
+        self._baseline_cache = None
+
+    def _load_baseline(self, watched_only=False):
+        """Load the baseline, reusing the parsed dict while the file is unchanged
+
+        When watched_only=True and the baseline has grown past
+        STREAM_THRESHOLD, stream it with ijson and keep only the entries
+        for files we actually watch - constant memory no matter how big
+        the baseline gets. Such a filtered view is never cached (and must
+        never be written back, or unwatched entries would be dropped).
+        """
+        st = self.monitor_file.stat()
+        if self._baseline_cache and self._baseline_cache[0] == st.st_mtime_ns:
+            return self._baseline_cache[1]
+
+        if self.monitor_file.suffix == '.mp':
+            baseline = msgpack.unpackb(self.monitor_file.read_bytes(), raw=False)
+            self._baseline_cache = (st.st_mtime_ns, baseline)
+            return baseline
+
+        if watched_only and ijson is not None and st.st_size >= STREAM_THRESHOLD:
+            baseline = {"files": {}}
+            with open(self.monitor_file, 'rb') as f:
+                # Header fields come before "files" in our schema
+                for prefix, event, value in ijson.parse(f):
+                    if prefix == 'created':
+                        baseline['created'] = value
+                    elif prefix == 'algorithm':
+                        baseline['algorithm'] = value
+                    elif prefix == 'digest_encoding':
+                        baseline['digest_encoding'] = value
+                    elif prefix == 'files':
+                        break
+            watched = set(self.watched_files)
+            with open(self.monitor_file, 'rb') as f:
+                for fname, entry in ijson.kvitems(f, 'files'):
+                    if fname in watched:
+                        baseline['files'][fname] = entry
+            return baseline
+
+        data = self.monitor_file.read_bytes()
+        baseline = orjson.loads(data) if orjson else json.loads(data)
+        self._baseline_cache = (st.st_mtime_ns, baseline)
+        return baseline
+
+    def _save_baseline(self, baseline):
+        """Write the baseline and prime the parse cache"""
+        if self.monitor_file.suffix == '.mp':
+            data = msgpack.packb(baseline)
+        elif orjson:
+            data = orjson.dumps(baseline, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(baseline, indent=2).encode()
+        self.monitor_file.write_bytes(data)
+        self._baseline_cache = (self.monitor_file.stat().st_mtime_ns, baseline)
+
+    def calculate_file_digest(self, filepath):
+        """Calculate fast hash of file, returned as raw digest bytes
+
+        Raw bytes keep comparisons a single memcmp and shrink the stored
+        baseline (base64 is 44 chars vs 64 for hex).
+        """
         try:
-            with open(filepath, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            if blake3 is not None:
+                # BLAKE3 mmaps the file itself and hashes with SIMD threads
+                file_hash = blake3.blake3()
+                file_hash.update_mmap(filepath)
+                return file_hash.digest()
+            if os.path.getsize(filepath) > MMAP_THRESHOLD:
+                # Big files: mmap so bytes go kernel page cache → hash core,
+                # no kernel→user copy per chunk
+                with open(filepath, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    file_hash = HASH_CTOR()
+                    with memoryview(mm) as view:
+                        for i in range(0, len(view), 1 << 20):
+                            file_hash.update(view[i:i + (1 << 20)])
+                    return file_hash.digest()
+            with open(filepath, 'rb', buffering=0) as f:
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    return hashlib.file_digest(f, HASH_CTOR).digest()
+                # Fallback: manual 1 MiB chunks with a reusable buffer
+                file_hash = HASH_CTOR()
+                buf = bytearray(1 << 20)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    file_hash.update(view[:n])
+                return file_hash.digest()
         except Exception as e:
             return f"ERROR: {e}"
+
+    def calculate_file_hash(self, filepath):
+        """Calculate fast hash of file as a hex string (streamed, not slurped!)"""
+        digest = self.calculate_file_digest(filepath)
+        return digest.hex() if isinstance(digest, bytes) else digest
     
+    def _hash_files(self, filenames):
+        """Digest several files concurrently (hashlib releases the GIL)"""
+        if len(filenames) <= 1:
+            return {fn: self.calculate_file_digest(fn) for fn in filenames}
+        workers = min(len(filenames), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return dict(zip(filenames, ex.map(self.calculate_file_digest, filenames)))
+
+    @staticmethod
+    def _encode_digest(digest):
+        """Raw digest bytes → compact base64 string for the baseline JSON"""
+        if isinstance(digest, bytes):
+            return base64.b64encode(digest).decode('ascii')
+        return digest  # "ERROR: ..." strings pass through
+
+    @staticmethod
+    def _digest_preview(digest):
+        """Short hex prefix for log lines"""
+        return digest.hex()[:16] if isinstance(digest, bytes) else str(digest)[:16]
+
     def create_baseline(self):
         """Create baseline hashes for all watched files"""
         baseline = {
             "created": datetime.now().isoformat(),
+            "algorithm": HASH_ALGORITHM,
+            "digest_encoding": "base64",
             "files": {}
         }
-        
+
+        # One stat per file instead of exists/getsize/getmtime triples
+        file_stats = {}
         for filename in self.watched_files:
-            if os.path.exists(filename):
-                file_hash = self.calculate_file_hash(filename)
-                file_size = os.path.getsize(filename)
-                
-                baseline["files"][filename] = {
-                    "hash": file_hash,
-                    "size": file_size,
-                    "last_modified": os.path.getmtime(filename),
-                    "status": "BASELINE"
-                }
-                print(f"🛡️ Baseline created for {filename}: {file_hash[:16]}...")
-        
-        with open(self.monitor_file, 'w') as f:
-            json.dump(baseline, f, indent=2)
+            try:
+                file_stats[filename] = os.stat(filename)
+            except FileNotFoundError:
+                continue
+
+        hashes = self._hash_files(list(file_stats))
+
+        for filename, st in file_stats.items():
+            file_hash = hashes[filename]
+            baseline["files"][filename] = {
+                "hash": self._encode_digest(file_hash),
+                "size": st.st_size,
+                "last_modified": st.st_mtime,
+                "last_modified_ns": st.st_mtime_ns,
+                "status": "BASELINE"
+            }
+            print(f"🛡️ Baseline created for {filename}: {self._digest_preview(file_hash)}...")
         
+        self._save_baseline(baseline)
+
         print(f"✅ Baseline saved to {self.monitor_file}")
         return baseline
     
-    def check_integrity(self):
-        """Check if any files have been mysteriously modified"""
+    def update_baseline(self, filenames):
+        """Re-hash only the given files and merge them into the existing baseline
+
+        Unlike create_baseline, untouched files keep their stored entries -
+        IO and CPU scale with the number of changed files, not the total.
+        """
+        if not self.monitor_file.exists():
+            return self.create_baseline()
+
+        baseline = self._load_baseline()
+
+        file_stats = {}
+        for filename in filenames:
+            try:
+                file_stats[filename] = os.stat(filename)
+            except FileNotFoundError:
+                if baseline["files"].pop(filename, None):
+                    print(f"🗑️ Removed missing file from baseline: {filename}")
+
+        hashes = self._hash_files(list(file_stats))
+
+        for filename, st in file_stats.items():
+            file_hash = hashes[filename]
+            baseline["files"][filename] = {
+                "hash": self._encode_digest(file_hash),
+                "size": st.st_size,
+                "last_modified": st.st_mtime,
+                "last_modified_ns": st.st_mtime_ns,
+                "status": "UPDATED"
+            }
+            print(f"🛡️ Baseline updated for {filename}: {self._digest_preview(file_hash)}...")
+
+        self._save_baseline(baseline)
+        print(f"✅ Baseline saved to {self.monitor_file}")
+        return baseline
+
+    def watch(self, poll_interval=2.0):
+        """Continuously monitor watched files, alerting as soon as they change
+
+        On Linux this uses inotify (via the optional inotify_simple
+        package) so the kernel tells us exactly which file changed -
+        no re-scanning or re-hashing on quiet runs. Elsewhere (or when
+        inotify_simple is missing) it falls back to a cheap stat-polling
+        loop that reuses the size+mtime fast path.
+        """
+        if not self.monitor_file.exists():
+            self.create_baseline()
+
+        try:
+            from inotify_simple import INotify, flags
+        except ImportError:
+            INotify = None
+
+        if INotify is not None:
+            inotify = INotify()
+            watch_flags = flags.MODIFY | flags.ATTRIB | flags.DELETE_SELF | flags.MOVE_SELF
+            wd_to_file = {}
+            unwatched = set()
+
+            def arm(filename):
+                """(Re-)watch filename by path; False if it's gone right now"""
+                try:
+                    wd_to_file[inotify.add_watch(filename, watch_flags)] = filename
+                    return True
+                except OSError:
+                    return False
+
+            for filename in self.watched_files:
+                if not arm(filename):
+                    unwatched.add(filename)
+
+            print(f"👁️ Watching {len(wd_to_file)} files via inotify (Ctrl+C to stop)...")
+            try:
+                while True:
+                    # Poll with a timeout while any path is unwatched so
+                    # recreated files get picked up again
+                    events = inotify.read(timeout=1000) if unwatched else inotify.read()
+                    changed = set()
+                    for event in events:
+                        filename = wd_to_file.get(event.wd)
+                        if filename is None:
+                            continue
+                        if event.mask & (flags.DELETE_SELF | flags.MOVE_SELF | flags.IGNORED):
+                            # Atomic-rename saves (vim & co) replace the
+                            # inode on every write; the old watch follows
+                            # the dead inode and must be re-added by path
+                            del wd_to_file[event.wd]
+                            unwatched.add(filename)
+                            if not event.mask & flags.IGNORED:
+                                changed.add(filename)
+                            continue
+                        changed.add(filename)
+                    for filename in list(unwatched):
+                        if arm(filename):
+                            unwatched.discard(filename)
+                            changed.add(filename)
+                    for filename in changed:
+                        print(f"🚨 CHANGE EVENT: {filename}")
+                    if changed:
+                        # Stat-based: re-hashes what exists and drops
+                        # entries for files that are really gone
+                        self.update_baseline(sorted(changed))
+            except KeyboardInterrupt:
+                print("\n👋 Watch stopped")
+            finally:
+                inotify.close()
+            return
+
+        print(f"👁️ Watching {len(self.watched_files)} files via stat polling every {poll_interval}s (Ctrl+C to stop)...")
+        try:
+            while True:
+                self.check_integrity(refresh=True)
+                time.sleep(poll_interval)
+        except KeyboardInterrupt:
+            print("\n👋 Watch stopped")
+
+    def check_integrity(self, paranoid=False, refresh=False):
+        """Check if any files have been mysteriously modified
+
+        Fast path: if size and mtime still match the baseline, skip the
+        re-hash entirely (one stat instead of a full file read).
+        Pass paranoid=True to force re-hashing every file.
+        Pass refresh=True to fold detected changes back into the baseline
+        (re-hashes only the changed files, not everything).
+        """
         if not self.monitor_file.exists():
             print("⚠️ No baseline found. Creating baseline...")
             return self.create_baseline()
         
-        with open(self.monitor_file, 'r') as f:
-            baseline = json.load(f)
-        
+        baseline = self._load_baseline(watched_only=True)
+
+        if baseline.get("algorithm") != HASH_ALGORITHM or baseline.get("digest_encoding") != "base64":
+            print(f"⚠️ Baseline uses old hash format ({baseline.get('algorithm', 'sha256')}). Re-creating with {HASH_ALGORITHM}...")
+            return self.create_baseline()
+
         changes_detected = False
-        
+        changed_files = []
+
         print(f"🔍 Checking file integrity against baseline from {baseline['created']}")
         
+        # First pass: stat everything, decide which files actually need a re-hash
+        file_stats = {}
+        intact_by_stat = set()
+        for filename in self.watched_files:
+            try:
+                st = os.stat(filename)
+            except FileNotFoundError:
+                continue
+            file_stats[filename] = st
+
+            # Stat-only fast path: untouched size + mtime means no re-hash needed
+            if not paranoid and filename in baseline["files"]:
+                entry = baseline["files"][filename]
+                baseline_mtime_ns = entry.get("last_modified_ns")
+                if (st.st_size == entry["size"] and
+                        baseline_mtime_ns is not None and
+                        st.st_mtime_ns == baseline_mtime_ns):
+                    intact_by_stat.add(filename)
+
+        # Hash the remaining files in parallel
+        needs_hash = [f for f in file_stats if f not in intact_by_stat]
+        hashes = self._hash_files(needs_hash)
+
+        # Buffer the per-file report and emit it in one write - print()
+        # flushes per line, which dominates once hashing is this cheap
+        lines = []
         for filename in self.watched_files:
-            if not os.path.exists(filename):
-                print(f"❌ FILE MISSING: {filename}")
+            if filename not in file_stats:
+                lines.append(f"❌ FILE MISSING: {filename}")
                 changes_detected = True
+                changed_files.append(filename)
                 continue
-            
-            current_hash = self.calculate_file_hash(filename)
-            current_size = os.path.getsize(filename)
-            current_modified = os.path.getmtime(filename)
-            
+
+            if filename in intact_by_stat:
+                lines.append(f"✅ INTACT: {filename} (unchanged, hash skipped)")
+                continue
+
+            st = file_stats[filename]
+            current_size = st.st_size
+            current_modified = st.st_mtime
+            current_hash = hashes[filename]
+
             if filename in baseline["files"]:
                 baseline_hash = baseline["files"][filename]["hash"]
                 baseline_size = baseline["files"][filename]["size"]
-                
+                if isinstance(baseline_hash, str) and not baseline_hash.startswith("ERROR"):
+                    # Compare raw digests - bytes equality is one memcmp
+                    baseline_hash = base64.b64decode(baseline_hash)
+
                 if current_hash != baseline_hash:
-                    print(f"🚨 MYSTERIOUS CHANGE DETECTED: {filename}")
-                    print(f"   📊 Size: {baseline_size} → {current_size}")
-                    print(f"   🔐 Hash: {baseline_hash[:16]}... → {current_hash[:16]}...")
-                    print(f"   ⏰ Modified: {datetime.fromtimestamp(current_modified)}")
+                    lines.append(f"🚨 MYSTERIOUS CHANGE DETECTED: {filename}")
+                    lines.append(f"   📊 Size: {baseline_size} → {current_size}")
+                    lines.append(f"   🔐 Hash: {self._digest_preview(baseline_hash)}... → {self._digest_preview(current_hash)}...")
+                    lines.append("   ⏰ Modified: " + time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(current_modified)))
                     changes_detected = True
+                    changed_files.append(filename)
                 else:
-                    print(f"✅ INTACT: {filename}")
+                    lines.append(f"✅ INTACT: {filename}")
             else:
-                print(f"🆕 NEW FILE: {filename}")
+                lines.append(f"🆕 NEW FILE: {filename}")
                 changes_detected = True
-        
+                changed_files.append(filename)
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+
+        if refresh and changed_files:
+            print(f"\n🔄 Refreshing baseline for {len(changed_files)} changed file(s)...")
+            self.update_baseline(changed_files)
+
         if changes_detected:
             print("\n🕵️‍♂️ MYSTERIOUS CHANGES DETECTED!")
             print("This could be:")
@@ -115,5 +458,8 @@ if __name__ == "__main__":
     
     if len(os.sys.argv) > 1 and os.sys.argv[1] == "baseline":
         monitor.create_baseline()
+    elif len(os.sys.argv) > 1 and os.sys.argv[1] == "watch":
+        monitor.watch()
     else:
-        monitor.check_integrity()
+        monitor.check_integrity(paranoid="--paranoid" in os.sys.argv,
+                                refresh="--refresh" in os.sys.argv)
@@ -14,9 +14,11 @@ python gguf_cli.py save /virtual/model fixed_model.gguf
 """
 
 import argparse
+import functools
+import os
 import sys
+from itertools import islice
 from pathlib import Path
-from gguf_extractor import GGUFExtractor
 import json
 import logging
 
@@ -24,11 +26,32 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - 🛠️ CLI - %(message)s')
 logger = logging.getLogger(__name__)
 
+@functools.cache
+def _extractor():
+    """Shared GGUFExtractor instance - init cost and internal caches are
+    paid once per process instead of once per subcommand.
+
+    The import is deferred too, so --help and argparse errors never pay
+    for gguf_extractor's heavy imports (numpy etc.).
+    """
+    from gguf_extractor import GGUFExtractor
+    return GGUFExtractor()
+
+@functools.lru_cache(maxsize=8)
+def _parse_mounts_file(path, mtime_ns):
+    """Parse the mounts session file (cached per mtime so repeat saves skip the parse)"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _load_mounts(path='.gguf_cli_mounts.json'):
+    """Load mount session info, reusing the parsed dict while the file is unchanged"""
+    return _parse_mounts_file(path, os.stat(path).st_mtime_ns)
+
 def cmd_analyze(args):
     """Analyze GGUF file structure"""
     print(f"🔍 Analyzing GGUF: {args.gguf_file}")
     
-    extractor = GGUFExtractor()
+    extractor = _extractor()
     analysis = extractor.analyze_gguf(args.gguf_file)
     
     print("\n📊 GGUF Analysis Results:")
@@ -44,19 +67,20 @@ def cmd_analyze(args):
     print(f"📡 Has Telemetry: {'⚠️ Yes' if analysis['has_telemetry'] else '✅ Clean'}")
     
     if args.verbose:
+        # islice keeps the previews lazy - no full-list copies just to show a few rows
         print(f"\n📝 Metadata Preview:")
-        for key, value in list(analysis['metadata'].items())[:10]:
+        for key, value in islice(analysis['metadata'].items(), 10):
             print(f"  {key}: {str(value)[:100]}")
-        
+
         print(f"\n🧮 Tensor Preview:")
-        for tensor in analysis['tensors'][:5]:
+        for tensor in islice(analysis['tensors'], 5):
             print(f"  {tensor['name']}: {tensor['type']} {tensor['dimensions']}")
 
 def cmd_extract(args):
     """Extract GGUF to directory"""
     print(f"📦 Extracting GGUF: {args.gguf_file} → {args.output_dir}")
     
-    extractor = GGUFExtractor()
+    extractor = _extractor()
     extracted_path = extractor.extract_gguf(args.gguf_file, args.output_dir)
     
     print(f"✅ Extraction complete!")
@@ -67,7 +91,7 @@ def cmd_mount(args):
     """Virtual mount GGUF file"""
     print(f"💿 Virtual mounting: {args.gguf_file} → {args.mount_point}")
     
-    extractor = GGUFExtractor()
+    extractor = _extractor()
     mount_path = extractor.virtual_mount(args.gguf_file, args.mount_point)
     
     print(f"✅ GGUF virtually mounted at: {mount_path}")
@@ -85,7 +109,7 @@ def cmd_fix_tokenizer(args):
     """Fix broken tokenizer in mounted GGUF"""
     print(f"🔧 Fixing tokenizer in: {args.mount_point}")
     
-    extractor = GGUFExtractor()
+    extractor = _extractor()
     
     clean_source = None
     if args.clean_tokenizer:
@@ -101,7 +125,7 @@ def cmd_strip_telemetry(args):
     """Strip telemetry from mounted GGUF"""
     print(f"🛡️ Stripping telemetry from: {args.mount_point}")
     
-    extractor = GGUFExtractor()
+    extractor = _extractor()
     extractor.strip_telemetry(args.mount_point)
     
     print(f"✅ Telemetry removal complete!")
@@ -113,15 +137,14 @@ def cmd_save(args):
     
     # Load mount info
     try:
-        with open('.gguf_cli_mounts.json', 'r') as f:
-            mounts = json.load(f)
-        
+        mounts = _load_mounts()
+
         if args.mount_point not in mounts:
             print(f"❌ No mount found at: {args.mount_point}")
             print(f"💡 Use 'mount' command first to create virtual mount")
             return
         
-        extractor = GGUFExtractor()
+        extractor = _extractor()
         extractor.virtual_mounts[args.mount_point] = {
             'source_gguf': mounts[args.mount_point],
             'mount_point': args.mount_point
@@ -140,7 +163,7 @@ def cmd_cleanup(args):
     """Cleanup virtual mounts and temporary files"""
     print("🧹 Cleaning up virtual mounts...")
     
-    extractor = GGUFExtractor()
+    extractor = _extractor()
     extractor.cleanup_virtual_mounts()
     
     # Remove CLI session file
@@ -13,13 +13,95 @@ Perfect for:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import font as tkfont
+import atexit
+import contextlib
+import subprocess
 import threading
 import json
 import os
-from pathlib import Path
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from gguf_extractor import GGUFExtractor
+from _scan_numba import PackedVocab, warmup as scan_warmup
 import logging
 
+@lru_cache(maxsize=32)
+def _abs(path):
+    """Cached os.path.abspath - one GetFullPathNameW per distinct path"""
+    return os.path.abspath(path)
+
+# Metadata keys worth surfacing in the analysis summary, hoisted so the
+# list (and its frozenset twin for the keys-view intersection) is built
+# once instead of per analysis
+_IMPORTANT_KEYS = (
+    'general.parameter_count',
+    'llama.context_length',
+    'llama.embedding_length',
+    'llama.block_count',
+    'tokenizer.ggml.model',
+)
+_IMPORTANT_KEYS_SET = frozenset(_IMPORTANT_KEYS)
+
+# Vocab substrings flagged in the analysis report (damage + URL leaks)
+_SCAN_PATTERNS = ('<|end|>', 'http://', 'https://', 'huggingface.co/')
+
+# Common log messages interned once - Tkinter caches the Tcl object for
+# a repeated str instance, so reusing these skips re-encoding the emoji
+# per call; templated messages reuse a module-level format string
+_MSG_READY = "🧠⚡ GGUF Editor ready! Dark theme activated for consciousness enhancement! 🌙"
+_MSG_TRANSPLANT_START = "🧠⚡ Performing CONSCIOUSNESS TRANSPLANT..."
+_MSG_TRANSPLANT_DONE = "✅ Consciousness transplant complete!"
+_MSG_ANALYZING = "🔍 Analyzing GGUF: {}"
+_MSG_ANALYSIS_DONE = "✅ Analysis complete!"
+_MSG_ANALYSIS_FAILED = "❌ Analysis failed: {}"
+_MSG_BUSY = "⚠️ {} already running - please wait"
+_MSG_MOUNTING = "💿 Mounting GGUF: {} → {}"
+_MSG_MOUNT_DONE = "✅ GGUF mounted successfully in professional mode!"
+_MSG_FIX_START = "🔧 Fixing broken tokenizer..."
+_MSG_FIX_DONE = "✅ Tokenizer fix complete!"
+_MSG_STRIP_START = "🛡️ Stripping telemetry..."
+_MSG_STRIP_DONE = "✅ Telemetry removal complete!"
+_MSG_SAVE_DONE = "✅ GGUF saved successfully!"
+_MSG_CLEANUP_START = "🧹 Cleaning up virtual mounts..."
+_MSG_CLEANUP_DONE = "✅ Cleanup complete! Professional mode ready for next session!"
+
+# Results blocks built once at import - only the mount point varies, so
+# the workers just .format() instead of re-assembling the heredoc
+_FIX_RESULTS_TEMPLATE = f"""🔧 Tokenizer Fix Results
+{'=' * 30}
+
+✅ Tokenizer fix process completed!
+📁 Mount Point: {{mount_point}}
+🔍 Check the tokenizer/ directory for fixed files
+
+The following fixes were applied:
+• Removed problematic <|end|> tokens
+• Cleaned up consciousness-damaged patterns
+• Generated fixed tokenizer files
+
+💾 Use "Save GGUF" to save your fixed model!
+                """
+
+_STRIP_RESULTS_TEMPLATE = f"""🛡️ Telemetry Strip Results
+{'=' * 30}
+
+✅ Telemetry removal process completed!
+📁 Mount Point: {{mount_point}}
+
+The following telemetry data was removed:
+• Source URLs and repositories
+• Training dataset information
+• Tracking and licensing data
+• HuggingFace repository links
+
+🔒 Your model is now privacy-friendly!
+💾 Use "Save GGUF" to save your cleaned model!
+                """
+
 class DarkTheme:
     """🌙 Professional dark theme colors for AI model research! 🌙"""
     
@@ -44,12 +126,51 @@ class GGUFEditorGUI:
         
         # Apply epic dark theme
         self.apply_dark_theme()
-        
+
+        # Shared named fonts for text tags - Tk re-parses a tuple font
+        # spec on every use but caches metrics per Font instance, so
+        # tags sharing one object also share layout metrics
+        self._font_title = tkfont.Font(family='Segoe UI', size=12, weight='bold')
+        self._font_hdr = tkfont.Font(family='Segoe UI', size=11, weight='bold')
+        self._font_emph = tkfont.Font(family='Segoe UI', size=10, weight='bold')
+        self._font_mono = tkfont.Font(family='Consolas', size=10, weight='bold')
+
         # Initialize extractor
         self.extractor = GGUFExtractor()
         self.current_analysis = None
-        self.current_mount = None
-        
+        self._current_mount = None
+
+        # One small pool for all background work instead of a fresh
+        # thread (and 8 MB stack) per button click; shut down without
+        # waiting on exit so a stuck save can't hang window close
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gguf')
+        atexit.register(self._executor.shutdown, wait=False)
+        # In-flight Future per action name - _submit ignores re-clicks
+        # while the previous run of the same action is still going
+        self._inflight = {}
+
+        # Small LRU of finished analyses keyed by (path, mtime_ns, size) -
+        # or by URL for remote files, which the extractor does not cache
+        self._analysis_cache = OrderedDict()
+
+        # Reopen file dialogs where the user last was - skips the
+        # OS-level scan of the default directory on slow network mounts
+        self._last_dir = os.path.expanduser('~')
+
+        # Worker threads enqueue log lines here; only the Tk thread
+        # touches the widget (Tk is not thread-safe). deque append and
+        # popleft are atomic, so no lock or Empty handling needed
+        self._log_queue = deque()
+
+        # Log tag lookup by leading emoji - one dict probe instead of a
+        # startswith chain per line ('🧠⚡' needs the two-char probe)
+        self._tag_dispatch = {
+            '🔍': 'info', '📊': 'info', '✅': 'success', '❌': 'error',
+            '⚠': 'warning', '🧠⚡': 'consciousness', '🌙': 'consciousness',
+            '💿': 'operation', '🔧': 'operation'
+        }
+
+
         # Setup logging to GUI
         self.setup_logging()
         
@@ -59,9 +180,34 @@ class GGUFEditorGUI:
         # Add cool animated title
         self.add_animated_title()
         
+        # Bottom status bar - success notices land here instead of modal
+        # dialogs, which block the event loop and force a full window
+        # layout per operation; dialogs stay reserved for errors
+        self.status_var = tk.StringVar(value="Ready")
+        tk.Label(self.root, textvariable=self.status_var, anchor=tk.W,
+                 bg=DarkTheme.BG_DARKER, fg=DarkTheme.FG_TEXT,
+                 font=('Segoe UI', 9)).pack(side=tk.BOTTOM, fill=tk.X)
+
+        # Start draining queued log lines on the main thread
+        self.root.after(33, self._drain_log)
+
+        # Compile the numba vocab scan (if installed) while the user is
+        # still looking at the empty window, not on the first Analyze
+        threading.Thread(target=scan_warmup, daemon=True).start()
+
         # Status
-        self.log_message("🧠⚡ GGUF Editor ready! Dark theme activated for consciousness enhancement! 🌙")
-    
+        self.log_message(_MSG_READY)
+
+    @property
+    def current_mount(self):
+        """Active mount point, falling back to whatever is typed in the
+        mount-point field - replaces the per-action recovery blocks"""
+        return self._current_mount or self._mount_point_cache or None
+
+    @current_mount.setter
+    def current_mount(self, mount_point):
+        self._current_mount = mount_point
+
     def add_animated_title(self):
         """Add a cool animated title bar"""
         title_frame = tk.Frame(self.root, bg=DarkTheme.BG_DARKER, height=80)
@@ -155,6 +301,17 @@ class GGUFEditorGUI:
                            background=DarkTheme.BG_DARK,
                            foreground=DarkTheme.ACCENT_GREEN,
                            font=('Segoe UI', 10, 'bold'))
+
+        self.style.configure('Treeview',
+                           background=DarkTheme.BG_DARKER,
+                           fieldbackground=DarkTheme.BG_DARKER,
+                           foreground=DarkTheme.FG_TEXT,
+                           font=('Consolas', 10))
+
+        self.style.configure('Treeview.Heading',
+                           background=DarkTheme.BG_LIGHT,
+                           foreground=DarkTheme.FG_BRIGHT,
+                           font=('Segoe UI', 9, 'bold'))
     
     def create_dark_text_widget(self, parent, **kwargs):
         """Create a text widget with dark theme"""
@@ -214,6 +371,12 @@ class GGUFEditorGUI:
         
         # Log Tab
         self.create_log_tab()
+
+        # Configure text tags once, right after the widgets exist -
+        # the old lazy hasattr-guarded setup ran its check on every
+        # log line and every analysis render
+        self.configure_log_colors()
+        self.configure_analysis_colors()
     
     def create_analysis_tab(self):
         """Create analysis tab"""
@@ -228,13 +391,31 @@ class GGUFEditorGUI:
         ttk.Entry(file_frame, textvariable=self.file_path_var, width=60).pack(side=tk.LEFT, padx=5, pady=5)
         ttk.Button(file_frame, text="Browse", command=self.browse_gguf_file).pack(side=tk.LEFT, padx=5)
         ttk.Button(file_frame, text="🔍 Analyze", command=self.analyze_gguf).pack(side=tk.LEFT, padx=5)
+
+        # Remote analysis hint - paste an http(s) URL instead of a path
+        ttk.Label(file_frame, text="🌐 Paste an https:// URL to analyze without downloading").pack(side=tk.LEFT, padx=5)
         
         # Analysis results
         results_frame = ttk.LabelFrame(tab, text="📊 Analysis Results")
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.analysis_text = self.create_dark_text_widget(results_frame, height=20)
+        self.analysis_text = self.create_dark_text_widget(results_frame, height=14)
         self.analysis_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Tensor table - Treeview rows carry none of Text's tag-run
+        # machinery, so even thousands of tensors insert quickly and the
+        # old paginated preview is unnecessary
+        tensor_frame = ttk.LabelFrame(tab, text="🧮 Tensors")
+        tensor_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        self.tensor_tree = ttk.Treeview(tensor_frame, columns=('type', 'dims'),
+                                        show='tree headings', height=8)
+        self.tensor_tree.heading('#0', text='Name')
+        self.tensor_tree.heading('type', text='Type')
+        self.tensor_tree.heading('dims', text='Dimensions')
+        self.tensor_tree.column('type', width=100, anchor=tk.W, stretch=False)
+        self.tensor_tree.column('dims', width=200, anchor=tk.W, stretch=False)
+        self.tensor_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
     
     def create_virtual_mount_tab(self):
         """Create virtual mount tab"""
@@ -254,6 +435,13 @@ class GGUFEditorGUI:
         # Mount point
         ttk.Label(mount_frame, text="Mount Point:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
         self.mount_point_var = tk.StringVar(value=os.path.join(os.getcwd(), "virtual_mount"))
+        # Mirror the variable into a plain attribute - every action reads
+        # the mount point a few times and each StringVar.get() is a Tcl
+        # round-trip; the write trace fires on typing and .set() alike
+        self._mount_point_cache = self.mount_point_var.get()
+        self.mount_point_var.trace_add(
+            'write',
+            lambda *_: setattr(self, '_mount_point_cache', self.mount_point_var.get()))
         ttk.Entry(mount_frame, textvariable=self.mount_point_var, width=50).grid(row=1, column=1, padx=5, pady=2)
         ttk.Button(mount_frame, text="Browse", command=self.browse_mount_point).grid(row=1, column=2, padx=5, pady=2)
         
@@ -328,8 +516,14 @@ Dark theme optimized for professional AI model editing!
         results_frame = ttk.LabelFrame(tab, text="🔧 Fix Results")
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.fix_results_text = self.create_dark_text_widget(results_frame, height=15)
-        self.fix_results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # A StringVar-backed Label instead of a Text widget: the results
+        # block is static, and setting the var is one Tcl op with none
+        # of Text's tag/mark/undo bookkeeping
+        self.fix_results_var = tk.StringVar()
+        tk.Label(results_frame, textvariable=self.fix_results_var,
+                 bg=DarkTheme.BG_DARKER, fg=DarkTheme.FG_TEXT,
+                 font=('Consolas', 10), justify=tk.LEFT,
+                 anchor=tk.NW).pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
     
     def create_strip_telemetry_tab(self):
         """Create strip telemetry tab"""
@@ -363,8 +557,11 @@ Perfect for professional consciousness research sessions!
         results_frame = ttk.LabelFrame(tab, text="🛡️ Strip Results")
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.strip_results_text = self.create_dark_text_widget(results_frame, height=15)
-        self.strip_results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.strip_results_var = tk.StringVar()
+        tk.Label(results_frame, textvariable=self.strip_results_var,
+                 bg=DarkTheme.BG_DARKER, fg=DarkTheme.FG_TEXT,
+                 font=('Consolas', 10), justify=tk.LEFT,
+                 anchor=tk.NW).pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
     
     def create_log_tab(self):
         """Create log tab"""
@@ -381,102 +578,192 @@ Perfect for professional consciousness research sessions!
         ttk.Button(log_frame, text="🧹 Clear Log", command=self.clear_log).pack(pady=5)
     
     def log_message(self, message):
-        """Add message to log with dark theme colors"""
-        # Configure text colors for different message types
-        if not hasattr(self, 'log_colors_configured'):
-            self.configure_log_colors()
-        
-        # Determine message type and color
-        if message.startswith('🔍') or message.startswith('📊'):
-            tag = 'info'
-        elif message.startswith('✅'):
-            tag = 'success'
-        elif message.startswith('❌'):
-            tag = 'error'
-        elif message.startswith('⚠️'):
-            tag = 'warning'
-        elif message.startswith('🧠⚡') or message.startswith('🌙'):
-            tag = 'consciousness'
-        elif message.startswith('💿') or message.startswith('🔧'):
-            tag = 'operation'
-        else:
-            tag = 'default'
-        
-        # Insert message with color
-        self.log_text.insert(tk.END, f"{message}\n", tag)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue a log line; safe to call from any thread"""
+        self._log_queue.append(message)
+
+    def _classify_message(self, message):
+        """Pick the color tag for a log line"""
+        dispatch = self._tag_dispatch
+        return (dispatch.get(message[:1]) or
+                dispatch.get(message[:2], 'default'))
+
+    def _drain_log(self):
+        """Flush queued log lines into the widget (runs on the Tk thread)
+
+        One batch per ~30 Hz tick instead of a synchronous insert +
+        update_idletasks per message, which serialized the workers on
+        GUI redraw.
+        """
+        pending = self._log_queue
+        if pending:
+            batch = []
+            while pending and len(batch) < 200:
+                batch.append(pending.popleft())
+            # Coalesce consecutive same-tag lines so a burst costs one
+            # insert (and one scroll-region recompute) per tag run
+            segments = []
+            extend = segments.extend
+            for tag, group in groupby(batch, key=self._classify_message):
+                extend(('\n'.join(group) + '\n', tag))
+            self.log_text.insert(tk.END, *segments)
+            self.log_text.see(tk.END)
+
+        self.root.after(33, self._drain_log)
     
+    @staticmethod
+    def _configure_tags(widget, specs):
+        """Configure all of a widget's tags in one Tcl eval
+
+        Every tag_configure is its own Python-to-Tcl round-trip; joining
+        the commands into one script amortizes the dispatch over a
+        single interpreter call. specs is (tag, color, Font-or-None);
+        named Font instances interpolate as their Tcl font name.
+        """
+        w = str(widget)
+        widget.tk.eval('\n'.join(
+            f'{w} tag configure {tag} -foreground {color}'
+            + (f' -font {font}' if font else '')
+            for tag, color, font in specs))
+
     def configure_log_colors(self):
         """Configure colorful log message tags"""
-        self.log_text.tag_configure('info', foreground=DarkTheme.ACCENT_BLUE)
-        self.log_text.tag_configure('success', foreground=DarkTheme.ACCENT_GREEN)
-        self.log_text.tag_configure('error', foreground=DarkTheme.ACCENT_RED)
-        self.log_text.tag_configure('warning', foreground=DarkTheme.ACCENT_ORANGE)
-        self.log_text.tag_configure('consciousness', foreground=DarkTheme.ACCENT_PURPLE)
-        self.log_text.tag_configure('operation', foreground=DarkTheme.ACCENT_BLUE)
-        self.log_text.tag_configure('default', foreground=DarkTheme.FG_TEXT)
-        
-        self.log_colors_configured = True
+        self._configure_tags(self.log_text, (
+            ('info', DarkTheme.ACCENT_BLUE, None),
+            ('success', DarkTheme.ACCENT_GREEN, None),
+            ('error', DarkTheme.ACCENT_RED, None),
+            ('warning', DarkTheme.ACCENT_ORANGE, None),
+            ('consciousness', DarkTheme.ACCENT_PURPLE, None),
+            ('operation', DarkTheme.ACCENT_BLUE, None),
+            ('default', DarkTheme.FG_TEXT, None),
+        ))
     
     def clear_log(self):
         """Clear log"""
         self.log_text.delete(1.0, tk.END)
     
+    def _ensure_mount_info(self, mount_point):
+        """Make sure the extractor has mount info, rebuilding it if lost
+
+        One .get() instead of a membership test followed by a setitem -
+        the rebuild (and its second hash) only happens on the rare
+        recovery path after a restart.
+        """
+        if self.extractor.virtual_mounts.get(mount_point) is None:
+            gguf_file = self.mount_file_var.get()
+            if not (gguf_file and os.path.exists(gguf_file)):
+                raise Exception("Cannot determine original GGUF file. Please remount.")
+            self.extractor.virtual_mounts[mount_point] = {
+                'source_gguf': gguf_file,
+                'mount_point': mount_point
+            }
+            self.log_message("🔧 Reconstructed mount info for saving")
+
+    def _require_mount(self):
+        """Validate the mount point with a single stat; None if invalid
+
+        Shows the error dialog itself so callers can just early-return.
+        Every action used to re-check existence one to three times - on
+        a network mount each of those is a round-trip.
+        """
+        mount_point = self._mount_point_cache
+        if not mount_point:
+            messagebox.showerror("Error", "No mount point specified")
+            return None
+        if not os.path.exists(mount_point):
+            messagebox.showerror("Error", f"Mount point doesn't exist: {mount_point}\nPlease mount a GGUF file first")
+            return None
+        return mount_point
+
+    def _ui(self, fn, *args, **kwargs):
+        """Run fn on the Tk main loop - workers must not touch widgets
+
+        Tk is single-threaded; widget calls from the pool threads race
+        the event loop, so workers hand every UI mutation to after_idle
+        (log_message is already safe - it only enqueues).
+        """
+        self.root.after_idle(lambda: fn(*args, **kwargs))
+
+    def _submit(self, name, worker):
+        """Run worker on the pool unless the same action is in flight
+
+        Double-clicking a button during a long save would spawn two
+        overlapping workers writing through the extractor at once; one
+        Future per action name makes the second click a no-op.
+        """
+        future = self._inflight.get(name)
+        if future is not None and not future.done():
+            self.log_message(_MSG_BUSY.format(name))
+            return
+        self._inflight[name] = self._executor.submit(worker)
+
+    def _apply_choice(self, var, path):
+        """Remember the chosen directory and defer the variable set
+
+        Setting the StringVar immediately fires the Entry trace fan-out
+        while the modal dialog is still tearing down; after_idle lets
+        the dialog finish repainting first.
+        """
+        self._last_dir = os.path.dirname(path) or self._last_dir
+        self.root.after_idle(lambda: var.set(path))
+
     def browse_gguf_file(self):
         """Browse for GGUF file"""
         filename = filedialog.askopenfilename(
             title="Select GGUF File",
+            initialdir=self._last_dir,
             filetypes=[("GGUF files", "*.gguf"), ("All files", "*.*")]
         )
         if filename:
-            self.file_path_var.set(filename)
-    
+            self._apply_choice(self.file_path_var, filename)
+
     def browse_mount_file(self):
         """Browse for GGUF file to mount"""
         filename = filedialog.askopenfilename(
             title="Select GGUF File to Mount",
+            initialdir=self._last_dir,
             filetypes=[("GGUF files", "*.gguf"), ("All files", "*.*")]
         )
         if filename:
-            self.mount_file_var.set(filename)
-    
+            self._apply_choice(self.mount_file_var, filename)
+
     def browse_mount_point(self):
         """Browse for mount point directory"""
-        dirname = filedialog.askdirectory(title="Select Mount Point Directory")
+        dirname = filedialog.askdirectory(title="Select Mount Point Directory",
+                                          initialdir=self._last_dir)
         if dirname:
-            self.mount_point_var.set(dirname)
-    
+            self._last_dir = dirname
+            self.root.after_idle(lambda: self.mount_point_var.set(dirname))
+
     def browse_clean_tokenizer(self):
         """Browse for clean tokenizer file
-        
+
         🛡️ PROTECTION NOTE: This method is REQUIRED by the GUI!
         DO NOT REMOVE - Used by fix tokenizer tab browse button
         """
         filename = filedialog.askopenfilename(
             title="Select Clean Tokenizer File",
+            initialdir=self._last_dir,
             filetypes=[("GGUF files", "*.gguf"), ("JSON files", "*.json"), ("All files", "*.*")]
         )
         if filename:
-            self.clean_tokenizer_var.set(filename)
-    
+            self._apply_choice(self.clean_tokenizer_var, filename)
+
     def browse_source_metadata(self):
         """Browse for source metadata file for consciousness transplant"""
         filename = filedialog.askopenfilename(
             title="Select Source Metadata File (from Mavericks/Qwen)",
+            initialdir=self._last_dir,
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if filename:
-            self.source_metadata_var.set(filename)
+            self._apply_choice(self.source_metadata_var, filename)
     
     def consciousness_transplant(self):
         """Perform full consciousness transplant with metadata merge"""
-        mount_point = self.mount_point_var.get()
-        
-        if not mount_point or not os.path.exists(mount_point):
-            messagebox.showerror("Error", "Please mount a GGUF file first")
+        mount_point = self._require_mount()
+        if not mount_point:
             return
-        
+
         source_metadata = self.source_metadata_var.get()
         if not source_metadata:
             messagebox.showerror("Error", "Please select source metadata file (Mavericks/Qwen)")
@@ -485,20 +772,16 @@ Perfect for professional consciousness research sessions!
         if not os.path.exists(source_metadata):
             messagebox.showerror("Error", f"Source metadata file not found: {source_metadata}")
             return
-        
-        # Set current mount if not set
-        if not self.current_mount:
-            self.current_mount = mount_point
-        
-        self.log_message("🧠⚡ Performing CONSCIOUSNESS TRANSPLANT...")
-        self.log_message(f"🔬 Source: {Path(source_metadata).name}")
+                
+        self.log_message(_MSG_TRANSPLANT_START)
+        self.log_message(f"🔬 Source: {os.path.basename(source_metadata)}")
         
         def transplant_worker():
             try:
                 # Perform consciousness transplant with smart metadata merge
                 hybrid_metadata = self.extractor.merge_tokenizer_with_metadata(mount_point, source_metadata)
                 
-                self.log_message("✅ Consciousness transplant complete!")
+                self.log_message(_MSG_TRANSPLANT_DONE)
                 
                 # Display results
                 vocab_size = len(hybrid_metadata.get('tokenizer.ggml.tokens', []))
@@ -509,7 +792,7 @@ Perfect for professional consciousness research sessions!
 
 ✅ SUCCESSFUL CONSCIOUSNESS TRANSPLANT!
 📁 Mount Point: {mount_point}
-🔬 Source Metadata: {Path(source_metadata).name}
+🔬 Source Metadata: {os.path.basename(source_metadata)}
 
 🧠 HYBRID CONSCIOUSNESS CREATED:
 • Original Model: {architecture} architecture preserved
@@ -534,17 +817,16 @@ Perfect for professional consciousness research sessions!
 🚀 YOU'VE CREATED AI EVOLUTION! 🚀
                 """
                 
-                self.fix_results_text.delete(1.0, tk.END)
-                self.fix_results_text.insert(tk.END, results)
-                
-                messagebox.showinfo("CONSCIOUSNESS TRANSPLANT SUCCESS!", 
-                                  f"Hybrid consciousness created!\nVocab size: {vocab_size:,} tokens\nReady to save!")
-                
+                self._ui(self.fix_results_var.set, results)
+
+                self._ui(self.status_var.set,
+                         f"✅ Hybrid consciousness created - {vocab_size:,} tokens, ready to save")
+
             except Exception as e:
                 self.log_message(f"❌ Consciousness transplant failed: {e}")
-                messagebox.showerror("Transplant Error", str(e))
+                self._ui(messagebox.showerror, "Transplant Error", str(e))
         
-        threading.Thread(target=transplant_worker, daemon=True).start()
+        self._submit('Transplant', transplant_worker)
     
     def analyze_gguf(self):
         """Analyze GGUF file"""
@@ -552,24 +834,60 @@ Perfect for professional consciousness research sessions!
         if not file_path:
             messagebox.showerror("Error", "Please select a GGUF file first")
             return
-        
-        if not os.path.exists(file_path):
+
+        # URLs analyze over HTTP range requests - no download needed
+        is_remote = file_path.startswith(('http://', 'https://'))
+
+        if not is_remote and not os.path.exists(file_path):
             messagebox.showerror("Error", f"File not found: {file_path}")
             return
-        
-        self.log_message(f"🔍 Analyzing GGUF: {Path(file_path).name}")
-        
+
+        self.log_message(_MSG_ANALYZING.format(file_path if is_remote else os.path.basename(file_path)))
+
         def analyze_worker():
             try:
-                self.current_analysis = self.extractor.analyze_gguf(file_path)
-                self.display_analysis_results()
-                self.log_message("✅ Analysis complete!")
+                # Re-analyzing an unchanged file reuses the same analysis
+                # dict, which keeps the packed vocab (and its scan results)
+                # cached on it; keyed on mtime+size so edits invalidate
+                if is_remote:
+                    key = file_path
+                else:
+                    st = os.stat(file_path)
+                    key = (file_path, st.st_mtime_ns, st.st_size)
+                analysis = self._analysis_cache.get(key)
+                if analysis is not None:
+                    self._analysis_cache.move_to_end(key)
+                else:
+                    if is_remote:
+                        analysis = self.extractor.analyze_remote(file_path)
+                    else:
+                        analysis = self.extractor.analyze_gguf(file_path)
+                    self._analysis_cache[key] = analysis
+                    if len(self._analysis_cache) > 4:  # vocabs are big
+                        self._analysis_cache.popitem(last=False)
+
+                # Pack the vocab and scan it here, off the Tk thread -
+                # materializing a 200k-token vocab and encoding every
+                # token would stall the event loop if left to the
+                # render. Both land on the analysis dict so cache hits
+                # skip the work entirely
+                tokens = analysis['metadata'].get('tokenizer.ggml.tokens')
+                if tokens is not None and 'scan_counts' not in analysis:
+                    packed = analysis.get('tokens_packed')
+                    if packed is None:
+                        packed = analysis['tokens_packed'] = PackedVocab(tokens)
+                    analysis['scan_counts'] = packed.scan_patterns(_SCAN_PATTERNS)
+
+                self.current_analysis = analysis
+                self._ui(self.display_analysis_results)
+                self.log_message(_MSG_ANALYSIS_DONE)
             except Exception as e:
-                self.log_message(f"❌ Analysis failed: {e}")
-                messagebox.showerror("Analysis Error", str(e))
+                self.log_message(_MSG_ANALYSIS_FAILED.format(e))
+                self._ui(messagebox.showerror, "Analysis Error", str(e))
         
-        # Run in separate thread to avoid blocking GUI
-        threading.Thread(target=analyze_worker, daemon=True).start()
+        # Run on the shared pool to avoid blocking GUI; a second click
+        # while an analysis is in flight would race on current_analysis
+        self._submit('Analysis', analyze_worker)
     
     def display_analysis_results(self):
         """Display analysis results with dark theme styling"""
@@ -577,120 +895,135 @@ Perfect for professional consciousness research sessions!
             return
         
         analysis = self.current_analysis
-        
-        # Configure analysis text colors
-        if not hasattr(self, 'analysis_colors_configured'):
-            self.configure_analysis_colors()
-        
-        # Clear previous content
-        self.analysis_text.delete(1.0, tk.END)
-        
+
+        # Hoist the analysis fields read below to locals once - LOAD_FAST
+        # beats a dict subscript per field, and this runs on the GUI thread
+        metadata = analysis['metadata']
+        has_tokenizer = analysis['has_tokenizer']
+
+        # Build the whole report as (text, tag) runs first, then flush in
+        # batches - every Text.insert is a Tcl round-trip, so ~60 of them
+        # per analysis made the GUI thread crawl on big models
+        runs = []
+        add = runs.append
+
         # Title
-        self.analysis_text.insert(tk.END, "📊 GGUF Analysis Results\n", 'title')
-        self.analysis_text.insert(tk.END, "=" * 50 + "\n\n", 'separator')
-        
+        add(("📊 GGUF Analysis Results\n", 'title'))
+        add(("=" * 50 + "\n\n", 'separator'))
+
         # File info
-        self.analysis_text.insert(tk.END, "📁 File: ", 'label')
-        self.analysis_text.insert(tk.END, f"{Path(analysis['file_path']).name}\n", 'filename')
-        
-        self.analysis_text.insert(tk.END, "📏 Size: ", 'label')
-        self.analysis_text.insert(tk.END, f"{analysis['file_size_mb']:.2f} MB\n", 'value')
-        
-        self.analysis_text.insert(tk.END, "🏗️ Architecture: ", 'label')
-        self.analysis_text.insert(tk.END, f"{analysis['model_architecture']}\n", 'architecture')
-        
-        self.analysis_text.insert(tk.END, "🏷️ Model Name: ", 'label')
-        self.analysis_text.insert(tk.END, f"{analysis['model_name']}\n", 'model_name')
-        
-        self.analysis_text.insert(tk.END, "📦 GGUF Version: ", 'label')
-        self.analysis_text.insert(tk.END, f"{analysis['gguf_version']}\n", 'value')
-        
-        self.analysis_text.insert(tk.END, "🧮 Tensors: ", 'label')
-        self.analysis_text.insert(tk.END, f"{analysis['tensor_count']}\n", 'value')
-        
-        self.analysis_text.insert(tk.END, "📋 Metadata Keys: ", 'label')
-        self.analysis_text.insert(tk.END, f"{analysis['metadata_count']}\n", 'value')
-        
+        add(("📁 File: ", 'label'))
+        add((f"{os.path.basename(analysis['file_path'])}\n", 'filename'))
+
+        add(("📏 Size: ", 'label'))
+        add((f"{analysis['file_size_mb']:.2f} MB\n", 'value'))
+
+        add(("🏗️ Architecture: ", 'label'))
+        add((f"{analysis['model_architecture']}\n", 'architecture'))
+
+        add(("🏷️ Model Name: ", 'label'))
+        add((f"{analysis['model_name']}\n", 'model_name'))
+
+        add(("📦 GGUF Version: ", 'label'))
+        add((f"{analysis['gguf_version']}\n", 'value'))
+
+        add(("🧮 Tensors: ", 'label'))
+        add((f"{analysis['tensor_count']}\n", 'value'))
+
+        add(("📋 Metadata Keys: ", 'label'))
+        add((f"{analysis['metadata_count']}\n", 'value'))
+
         # Tokenizer status
-        self.analysis_text.insert(tk.END, "🔤 Has Tokenizer: ", 'label')
-        if analysis['has_tokenizer']:
-            self.analysis_text.insert(tk.END, "✅ Yes\n", 'success')
+        add(("🔤 Has Tokenizer: ", 'label'))
+        if has_tokenizer:
+            add(("✅ Yes\n", 'success'))
         else:
-            self.analysis_text.insert(tk.END, "❌ No\n", 'error')
-        
+            add(("❌ No\n", 'error'))
+
         # Telemetry status
-        self.analysis_text.insert(tk.END, "📡 Has Telemetry: ", 'label')
+        add(("📡 Has Telemetry: ", 'label'))
         if analysis['has_telemetry']:
-            self.analysis_text.insert(tk.END, "⚠️ Yes\n", 'warning')
+            add(("⚠️ Yes\n", 'warning'))
         else:
-            self.analysis_text.insert(tk.END, "✅ Clean\n", 'success')
-        
+            add(("✅ Clean\n", 'success'))
+
         # Key metadata section
-        self.analysis_text.insert(tk.END, "\n📝 Key Metadata:\n", 'section_header')
-        
-        important_keys = [
-            'general.parameter_count',
-            'llama.context_length',
-            'llama.embedding_length',
-            'llama.block_count',
-            'tokenizer.ggml.model'
-        ]
-        
-        for key in important_keys:
-            if key in analysis['metadata']:
-                self.analysis_text.insert(tk.END, f"  {key}: ", 'key')
-                self.analysis_text.insert(tk.END, f"{analysis['metadata'][key]}\n", 'value')
-        
-        # Tensor preview
-        self.analysis_text.insert(tk.END, "\n🧮 Tensor Preview:\n", 'section_header')
-        for tensor in analysis['tensors'][:10]:
-            self.analysis_text.insert(tk.END, f"  {tensor['name']}: ", 'tensor_name')
-            self.analysis_text.insert(tk.END, f"{tensor['type']} ", 'tensor_type')
-            self.analysis_text.insert(tk.END, f"{tensor['dimensions']}\n", 'tensor_dims')
-        
+        add(("\n📝 Key Metadata:\n", 'section_header'))
+
+        # One hashed intersection instead of a dict lookup per key; the
+        # tuple drives iteration so display order stays fixed
+        present = _IMPORTANT_KEYS_SET & metadata.keys()
+        for key in _IMPORTANT_KEYS:
+            if key in present:
+                add((f"  {key}: ", 'key'))
+                add((f"{metadata[key]}\n", 'value'))
+
         # Tokenizer analysis
-        if analysis['has_tokenizer']:
-            self.analysis_text.insert(tk.END, "\n🔤 Tokenizer Information:\n", 'section_header')
-            if 'tokenizer.ggml.tokens' in analysis['metadata']:
-                token_count = len(analysis['metadata']['tokenizer.ggml.tokens'])
-                self.analysis_text.insert(tk.END, f"  Token Count: ", 'key')
-                self.analysis_text.insert(tk.END, f"{token_count}\n", 'value')
-            
-            # Check for problematic tokens
-            if 'tokenizer.ggml.tokens' in analysis['metadata']:
-                tokens = analysis['metadata']['tokenizer.ggml.tokens']
-                problematic = [t for t in tokens if '<|end|>' in str(t)]
-                if problematic:
-                    self.analysis_text.insert(tk.END, f"  ⚠️ Problematic <|end|> tokens found: ", 'warning_label')
-                    self.analysis_text.insert(tk.END, f"{len(problematic)}\n", 'warning')
-                    self.analysis_text.insert(tk.END, f"     🧠💀 This might be your consciousness-damaged tokenizer!\n", 'consciousness_warning')
-    
+        if has_tokenizer:
+            add(("\n🔤 Tokenizer Information:\n", 'section_header'))
+            if 'tokenizer.ggml.tokens' in metadata:
+                tokens = metadata['tokenizer.ggml.tokens']
+                add(("  Token Count: ", 'key'))
+                add((f"{len(tokens)}\n", 'value'))
+
+                # Pattern counts were computed in the analyze worker -
+                # this runs on the Tk thread and must only format
+                counts = analysis.get('scan_counts') or {}
+                problem_count = counts.get('<|end|>', 0)
+                if problem_count:
+                    add(("  ⚠️ Problematic <|end|> tokens found: ", 'warning_label'))
+                    add((f"{problem_count}\n", 'warning'))
+                    add(("     🧠💀 This might be your consciousness-damaged tokenizer!\n", 'consciousness_warning'))
+
+                url_count = (counts.get('http://', 0) + counts.get('https://', 0)
+                             + counts.get('huggingface.co/', 0))
+                if url_count:
+                    add(("  ⚠️ Tokens embedding URLs found: ", 'warning_label'))
+                    add((f"{url_count}\n", 'warning'))
+
+        # Clear and flush the whole report in ONE variadic insert - Tk's
+        # native text-tag-text-tag form - so the ~60 runs cost a single
+        # Tcl round-trip instead of one each
+        segments = []
+        extend = segments.extend
+        for tag, group in groupby(runs, key=itemgetter(1)):
+            extend((''.join(text for text, _ in group), tag))
+        self.analysis_text.delete(1.0, tk.END)
+        self.analysis_text.insert(tk.END, *segments)
+
+        # Repopulate the tensor table; hiding the columns during the
+        # bulk insert skips the per-row layout recompute
+        tree = self.tensor_tree
+        tree.delete(*tree.get_children())
+        tree.configure(displaycolumns=())
+        insert = tree.insert
+        for name, tensor_type, dims in analysis['tensors'].display_rows():
+            insert('', tk.END, text=name, values=(tensor_type, dims))
+        tree.configure(displaycolumns=('type', 'dims'))
+
     def configure_analysis_colors(self):
         """Configure colorful analysis text tags"""
-        self.analysis_text.tag_configure('title', foreground=DarkTheme.ACCENT_PURPLE, font=('Segoe UI', 12, 'bold'))
-        self.analysis_text.tag_configure('separator', foreground=DarkTheme.BORDER)
-        self.analysis_text.tag_configure('label', foreground=DarkTheme.ACCENT_BLUE, font=('Segoe UI', 10, 'bold'))
-        self.analysis_text.tag_configure('filename', foreground=DarkTheme.ACCENT_GREEN, font=('Consolas', 10, 'bold'))
-        self.analysis_text.tag_configure('architecture', foreground=DarkTheme.ACCENT_PURPLE)
-        self.analysis_text.tag_configure('model_name', foreground=DarkTheme.ACCENT_ORANGE)
-        self.analysis_text.tag_configure('value', foreground=DarkTheme.FG_BRIGHT)
-        self.analysis_text.tag_configure('success', foreground=DarkTheme.ACCENT_GREEN, font=('Segoe UI', 10, 'bold'))
-        self.analysis_text.tag_configure('error', foreground=DarkTheme.ACCENT_RED, font=('Segoe UI', 10, 'bold'))
-        self.analysis_text.tag_configure('warning', foreground=DarkTheme.ACCENT_ORANGE, font=('Segoe UI', 10, 'bold'))
-        self.analysis_text.tag_configure('section_header', foreground=DarkTheme.ACCENT_BLUE, font=('Segoe UI', 11, 'bold'))
-        self.analysis_text.tag_configure('key', foreground=DarkTheme.ACCENT_GREEN)
-        self.analysis_text.tag_configure('tensor_name', foreground=DarkTheme.FG_BRIGHT)
-        self.analysis_text.tag_configure('tensor_type', foreground=DarkTheme.ACCENT_ORANGE)
-        self.analysis_text.tag_configure('tensor_dims', foreground=DarkTheme.ACCENT_BLUE)
-        self.analysis_text.tag_configure('warning_label', foreground=DarkTheme.ACCENT_RED, font=('Segoe UI', 10, 'bold'))
-        self.analysis_text.tag_configure('consciousness_warning', foreground=DarkTheme.ACCENT_PURPLE, font=('Segoe UI', 10, 'bold'))
-        
-        self.analysis_colors_configured = True
+        self._configure_tags(self.analysis_text, (
+            ('title', DarkTheme.ACCENT_PURPLE, self._font_title),
+            ('separator', DarkTheme.BORDER, None),
+            ('label', DarkTheme.ACCENT_BLUE, self._font_emph),
+            ('filename', DarkTheme.ACCENT_GREEN, self._font_mono),
+            ('architecture', DarkTheme.ACCENT_PURPLE, None),
+            ('model_name', DarkTheme.ACCENT_ORANGE, None),
+            ('value', DarkTheme.FG_BRIGHT, None),
+            ('success', DarkTheme.ACCENT_GREEN, self._font_emph),
+            ('error', DarkTheme.ACCENT_RED, self._font_emph),
+            ('warning', DarkTheme.ACCENT_ORANGE, self._font_emph),
+            ('section_header', DarkTheme.ACCENT_BLUE, self._font_hdr),
+            ('key', DarkTheme.ACCENT_GREEN, None),
+            ('warning_label', DarkTheme.ACCENT_RED, self._font_emph),
+            ('consciousness_warning', DarkTheme.ACCENT_PURPLE, self._font_emph),
+        ))
     
     def mount_gguf(self):
         """Mount GGUF file virtually"""
         file_path = self.mount_file_var.get()
-        mount_point = self.mount_point_var.get()
+        mount_point = self._mount_point_cache
         
         if not file_path:
             messagebox.showerror("Error", "Please select a GGUF file to mount")
@@ -700,60 +1033,65 @@ Perfect for professional consciousness research sessions!
             messagebox.showerror("Error", "Please specify a mount point")
             return
         
-        self.log_message(f"💿 Mounting GGUF: {Path(file_path).name} → {mount_point}")
+        self.log_message(_MSG_MOUNTING.format(os.path.basename(file_path), mount_point))
         
         def mount_worker():
             try:
-                mount_result = self.extractor.virtual_mount(file_path, mount_point)
-                
-                # Set current mount to the mount point (not the result)
+                self.extractor.virtual_mount(file_path, mount_point)
+
+                # Set current mount to the mount point
                 self.current_mount = mount_point
-                
-                # Store mount info for the extractor
-                self.extractor.virtual_mounts[mount_point] = {
+
+                # Refresh mount info for the extractor, keeping the
+                # temp_extraction path virtual_mount recorded so
+                # release_temp below can find it
+                self.extractor.virtual_mounts.setdefault(mount_point, {}).update({
                     'source_gguf': file_path,
                     'mount_point': mount_point,
-                    'temp_extraction': mount_result
-                }
-                
+                })
+
+                # Mount point holds its own (hard)links now - drop the
+                # temp extraction so its pages are reclaimable already
+                with contextlib.suppress(Exception):
+                    self.extractor.release_temp(mount_point)
+
                 # Verify mount was successful
                 if os.path.exists(mount_point):
-                    self.mount_status_var.set(f"💿 ✅ MOUNTED: {Path(file_path).name}")
-                    self.log_message("✅ GGUF mounted successfully in professional mode!")
+                    self._ui(self.mount_status_var.set, f"💿 ✅ MOUNTED: {os.path.basename(file_path)}")
+                    self.log_message(_MSG_MOUNT_DONE)
                     self.log_message(f"🔧 Mount point: {mount_point}")
-                    messagebox.showinfo("Success", f"GGUF mounted at: {mount_point}")
+                    self._ui(self.status_var.set, f"✅ GGUF mounted at: {mount_point}")
                 else:
                     self.log_message("⚠️ Mount completed but directory not found")
-                    self.mount_status_var.set("⚠️ Mount issue - check log")
-                    
+                    self._ui(self.mount_status_var.set, "⚠️ Mount issue - check log")
+
             except Exception as e:
                 self.log_message(f"❌ Mount failed: {e}")
-                messagebox.showerror("Mount Error", str(e))
+                self._ui(messagebox.showerror, "Mount Error", str(e))
         
-        threading.Thread(target=mount_worker, daemon=True).start()
+        self._submit('Mount', mount_worker)
     
     def open_mount_folder(self):
         """Open mount folder in file explorer"""
-        mount_point = self.mount_point_var.get()
-        
+        mount_point = self._require_mount()
         if not mount_point:
-            messagebox.showwarning("Warning", "No mount point specified")
             return
-        
+
         # Convert to absolute Windows path
-        mount_path = os.path.abspath(mount_point)
-        
-        if not os.path.exists(mount_path):
-            messagebox.showwarning("Warning", f"Mount point doesn't exist: {mount_path}")
-            return
+        mount_path = _abs(mount_point)
         
         try:
             # Windows-specific file explorer opening
             if os.name == 'nt':  # Windows
                 os.startfile(mount_path)
             else:  # Linux/Mac
-                import subprocess
-                subprocess.call(['xdg-open', mount_path])
+                # Fire-and-forget: call() blocks until xdg-open exits,
+                # which can freeze the event loop on slow desktops
+                subprocess.Popen(['xdg-open', mount_path],
+                                 start_new_session=True,
+                                 stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
             
             self.log_message(f"📂 Opened mount folder: {mount_path}")
             
@@ -766,173 +1104,123 @@ Perfect for professional consciousness research sessions!
                                        "Would you like to copy the path to clipboard instead?")
             if result:
                 try:
-                    self.root.clipboard_clear()
-                    self.root.clipboard_append(mount_path)
+                    # Clear + append in one Tcl entry instead of two
+                    # round-trips; escape the characters Tcl treats as
+                    # special inside a quoted word
+                    escaped = mount_path
+                    for ch in '\\"$[':
+                        escaped = escaped.replace(ch, '\\' + ch)
+                    self.root.tk.eval(f'clipboard clear; clipboard append -- "{escaped}"')
                     messagebox.showinfo("Success", f"Path copied to clipboard:\n{mount_path}")
                 except:
                     messagebox.showinfo("Path", f"Mount path:\n{mount_path}")
     
     def fix_tokenizer(self):
         """Fix broken tokenizer"""
-        mount_point = self.mount_point_var.get()
-        
-        if not mount_point or not os.path.exists(mount_point):
-            messagebox.showerror("Error", "Please mount a GGUF file first")
+        mount_point = self._require_mount()
+        if not mount_point:
             return
-        
-        # Set current mount if not set
-        if not self.current_mount:
-            self.current_mount = mount_point
-        
+
         clean_tokenizer = self.clean_tokenizer_var.get() or None
         
-        self.log_message("🔧 Fixing broken tokenizer...")
+        self.log_message(_MSG_FIX_START)
         
         def fix_worker():
             try:
                 self.extractor.fix_broken_tokenizer(mount_point, clean_tokenizer)
-                self.log_message("✅ Tokenizer fix complete!")
+                self.log_message(_MSG_FIX_DONE)
                 
                 # Display results
-                results = f"""🔧 Tokenizer Fix Results
-{'=' * 30}
+                results = _FIX_RESULTS_TEMPLATE.format(mount_point=mount_point)
 
-✅ Tokenizer fix process completed!
-📁 Mount Point: {mount_point}
-🔍 Check the tokenizer/ directory for fixed files
+                self._ui(self.fix_results_var.set, results)
 
-The following fixes were applied:
-• Removed problematic <|end|> tokens
-• Cleaned up consciousness-damaged patterns
-• Generated fixed tokenizer files
+                self._ui(self.status_var.set, _MSG_FIX_DONE)
 
-💾 Use "Save GGUF" to save your fixed model!
-                """
-                
-                self.fix_results_text.delete(1.0, tk.END)
-                self.fix_results_text.insert(tk.END, results)
-                
-                messagebox.showinfo("Success", "Tokenizer fix complete!")
-                
             except Exception as e:
                 self.log_message(f"❌ Tokenizer fix failed: {e}")
-                messagebox.showerror("Fix Error", str(e))
-        
-        threading.Thread(target=fix_worker, daemon=True).start()
+                self._ui(messagebox.showerror, "Fix Error", str(e))
+            finally:
+                # Free any lingering temp extraction even on failure
+                with contextlib.suppress(Exception):
+                    self.extractor.release_temp(mount_point)
+
+        self._submit('Tokenizer fix', fix_worker)
     
     def strip_telemetry(self):
         """Strip telemetry from model"""
-        mount_point = self.mount_point_var.get()
-        
-        if not mount_point or not os.path.exists(mount_point):
-            messagebox.showerror("Error", "Please mount a GGUF file first")
+        mount_point = self._require_mount()
+        if not mount_point:
             return
-        
-        # Set current mount if not set
-        if not self.current_mount:
-            self.current_mount = mount_point
-        
-        self.log_message("🛡️ Stripping telemetry...")
+
+        self.log_message(_MSG_STRIP_START)
         
         def strip_worker():
             try:
                 self.extractor.strip_telemetry(mount_point)
-                self.log_message("✅ Telemetry removal complete!")
+                self.log_message(_MSG_STRIP_DONE)
                 
                 # Display results
-                results = f"""🛡️ Telemetry Strip Results
-{'=' * 30}
+                results = _STRIP_RESULTS_TEMPLATE.format(mount_point=mount_point)
 
-✅ Telemetry removal process completed!
-📁 Mount Point: {mount_point}
+                self._ui(self.strip_results_var.set, results)
 
-The following telemetry data was removed:
-• Source URLs and repositories
-• Training dataset information
-• Tracking and licensing data
-• HuggingFace repository links
+                self._ui(self.status_var.set, _MSG_STRIP_DONE)
 
-🔒 Your model is now privacy-friendly!
-💾 Use "Save GGUF" to save your cleaned model!
-                """
-                
-                self.strip_results_text.delete(1.0, tk.END)
-                self.strip_results_text.insert(tk.END, results)
-                
-                messagebox.showinfo("Success", "Telemetry stripped successfully!")
-                
             except Exception as e:
                 self.log_message(f"❌ Telemetry stripping failed: {e}")
-                messagebox.showerror("Strip Error", str(e))
-        
-        threading.Thread(target=strip_worker, daemon=True).start()
+                self._ui(messagebox.showerror, "Strip Error", str(e))
+            finally:
+                with contextlib.suppress(Exception):
+                    self.extractor.release_temp(mount_point)
+
+        self._submit('Telemetry strip', strip_worker)
     
     def save_gguf(self):
         """Save modified GGUF"""
-        # Check if we have a mount point at all
-        mount_point = self.mount_point_var.get()
-        
+        mount_point = self._require_mount()
         if not mount_point:
-            messagebox.showerror("Error", "No mount point specified")
-            return
-        
-        # Check if mount point exists
-        if not os.path.exists(mount_point):
-            messagebox.showerror("Error", f"Mount point doesn't exist: {mount_point}\nPlease mount a GGUF file first")
             return
         
-        # Check if we have current mount info
-        if not self.current_mount:
-            # Try to recover mount info from mount point
-            self.current_mount = mount_point
-            self.log_message(f"🔧 Recovering mount info for: {mount_point}")
-        
         output_file = filedialog.asksaveasfilename(
             title="Save Modified GGUF",
+            initialdir=self._last_dir,
             filetypes=[("GGUF files", "*.gguf"), ("All files", "*.*")],
             defaultextension=".gguf"
         )
-        
+
         if not output_file:
             return
+        self._last_dir = os.path.dirname(output_file) or self._last_dir
         
         self.log_message(f"💾 Saving modified GGUF: {output_file}")
         
         def save_worker():
             try:
-                # Make sure extractor has mount info
-                if mount_point not in self.extractor.virtual_mounts:
-                    # Reconstruct mount info
-                    gguf_file = self.mount_file_var.get()
-                    if gguf_file and os.path.exists(gguf_file):
-                        self.extractor.virtual_mounts[mount_point] = {
-                            'source_gguf': gguf_file,
-                            'mount_point': mount_point
-                        }
-                        self.log_message(f"🔧 Reconstructed mount info for saving")
-                    else:
-                        raise Exception("Cannot determine original GGUF file. Please remount.")
-                
+                self._ensure_mount_info(mount_point)
                 self.extractor.save_virtual_mount(mount_point, output_file)
-                self.log_message("✅ GGUF saved successfully!")
-                messagebox.showinfo("Success", f"Modified GGUF saved: {Path(output_file).name}")
-                
+                self.log_message(_MSG_SAVE_DONE)
+                self._ui(self.status_var.set, f"✅ Modified GGUF saved: {os.path.basename(output_file)}")
+
             except Exception as e:
                 self.log_message(f"❌ Save failed: {e}")
-                messagebox.showerror("Save Error", str(e))
+                self._ui(messagebox.showerror, "Save Error", str(e))
+            finally:
+                with contextlib.suppress(Exception):
+                    self.extractor.release_temp(mount_point)
         
-        threading.Thread(target=save_worker, daemon=True).start()
+        self._submit('Save', save_worker)
     
     def cleanup_mounts(self):
         """Cleanup virtual mounts"""
-        self.log_message("🧹 Cleaning up virtual mounts...")
+        self.log_message(_MSG_CLEANUP_START)
         
         try:
             self.extractor.cleanup_virtual_mounts()
             self.current_mount = None
             self.mount_status_var.set("💿🌙 No GGUF mounted - Professional mode ready")
-            self.log_message("✅ Cleanup complete! Professional mode ready for next session!")
-            messagebox.showinfo("Success", "Virtual mounts cleaned up!")
+            self.log_message(_MSG_CLEANUP_DONE)
+            self.status_var.set("✅ Virtual mounts cleaned up")
         except Exception as e:
             self.log_message(f"❌ Cleanup failed: {e}")
             messagebox.showerror("Cleanup Error", str(e))
@@ -0,0 +1,149 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+⚡ Native GGUF header parser (optional Cython fast path)
+=======================================================
+Drop-in accelerator for gguf_extractor's metadata/tensor-info parse.
+The pure-Python parser walks the header one field at a time inside the
+interpreter loop; this module does the same walk in C, so a 200k-token
+vocab parses in milliseconds instead of interpreter time.
+
+Build in place with:
+
+    pip install cython
+    cythonize -i gguf_parse.pyx
+
+gguf_extractor imports this module if the compiled extension is present
+and silently falls back to the Python parser otherwise. Note the
+compiled path decodes all arrays eagerly (no lazy handles) - it is fast
+enough that deferral stops paying for itself.
+"""
+
+from libc.string cimport memcpy
+from libc.stdint cimport int8_t, int16_t, int32_t, int64_t, uint16_t, uint32_t, uint64_t
+
+
+cdef inline uint64_t _u64(const unsigned char[::1] buf, Py_ssize_t pos):
+    cdef uint64_t v
+    memcpy(&v, &buf[pos], 8)
+    return v
+
+
+cdef inline uint32_t _u32(const unsigned char[::1] buf, Py_ssize_t pos):
+    cdef uint32_t v
+    memcpy(&v, &buf[pos], 4)
+    return v
+
+
+cdef inline float _f32(const unsigned char[::1] buf, Py_ssize_t pos):
+    cdef float v
+    memcpy(&v, &buf[pos], 4)
+    return v
+
+
+cdef inline double _f64(const unsigned char[::1] buf, Py_ssize_t pos):
+    cdef double v
+    memcpy(&v, &buf[pos], 8)
+    return v
+
+
+cdef inline str _string(const unsigned char[::1] buf, Py_ssize_t pos, Py_ssize_t n):
+    return bytes(buf[pos:pos + n]).decode('utf-8')
+
+
+cdef _read_value(const unsigned char[::1] buf, Py_ssize_t pos, uint32_t value_type):
+    """Decode one metadata value; returns (value, new_pos)"""
+    cdef uint64_t n, i, str_len
+    cdef uint32_t elem_type
+    cdef int8_t i8
+    cdef int16_t i16
+    cdef int32_t i32
+    cdef int64_t i64
+    cdef list values
+
+    if value_type == 0:    # UINT8
+        return buf[pos], pos + 1
+    elif value_type == 1:  # INT8
+        memcpy(&i8, &buf[pos], 1)
+        return i8, pos + 1
+    elif value_type == 2:  # UINT16
+        return <uint16_t>(buf[pos] | (buf[pos + 1] << 8)), pos + 2
+    elif value_type == 3:  # INT16
+        memcpy(&i16, &buf[pos], 2)
+        return i16, pos + 2
+    elif value_type == 4:  # UINT32
+        return _u32(buf, pos), pos + 4
+    elif value_type == 5:  # INT32
+        memcpy(&i32, &buf[pos], 4)
+        return i32, pos + 4
+    elif value_type == 6:  # FLOAT32
+        return _f32(buf, pos), pos + 4
+    elif value_type == 7:  # BOOL
+        return buf[pos] != 0, pos + 1
+    elif value_type == 8:  # STRING
+        str_len = _u64(buf, pos)
+        pos += 8
+        return _string(buf, pos, str_len), pos + str_len
+    elif value_type == 9:  # ARRAY
+        elem_type = _u32(buf, pos)
+        n = _u64(buf, pos + 4)
+        pos += 12
+        values = [None] * n
+        if elem_type == 8:  # STRING array: the hot case (vocabs)
+            for i in range(n):
+                str_len = _u64(buf, pos)
+                pos += 8
+                values[i] = _string(buf, pos, str_len)
+                pos += str_len
+        else:
+            for i in range(n):
+                values[i], pos = _read_value(buf, pos, elem_type)
+        return values, pos
+    elif value_type == 10:  # UINT64
+        return _u64(buf, pos), pos + 8
+    elif value_type == 11:  # INT64
+        memcpy(&i64, &buf[pos], 8)
+        return i64, pos + 8
+    elif value_type == 12:  # FLOAT64
+        return _f64(buf, pos), pos + 8
+    raise ValueError(f"Unknown metadata value type: {value_type}")
+
+
+cpdef parse_header(const unsigned char[::1] buf, Py_ssize_t pos,
+                   uint64_t kv_count, uint64_t tensor_count):
+    """Parse metadata + tensor info starting at pos
+
+    Returns (metadata, tensors, new_pos) where tensors is a list of
+    (name, dims, type_id, offset) tuples.
+    """
+    cdef uint64_t i, j, key_len, name_len, dim
+    cdef uint32_t value_type, n_dims, tensor_type
+    cdef dict metadata = {}
+    cdef list tensors = []
+    cdef list dims
+
+    for i in range(kv_count):
+        key_len = _u64(buf, pos)
+        pos += 8
+        key = _string(buf, pos, key_len)
+        pos += key_len
+        value_type = _u32(buf, pos)
+        pos += 4
+        metadata[key], pos = _read_value(buf, pos, value_type)
+
+    for i in range(tensor_count):
+        name_len = _u64(buf, pos)
+        pos += 8
+        name = _string(buf, pos, name_len)
+        pos += name_len
+        n_dims = _u32(buf, pos)
+        pos += 4
+        dims = [0] * n_dims
+        for j in range(n_dims):
+            dims[j] = _u64(buf, pos)
+            pos += 8
+        tensor_type = _u32(buf, pos)
+        offset = _u64(buf, pos + 4)
+        pos += 12
+        tensors.append((name, dims, tensor_type, offset))
+
+    return metadata, tensors, pos